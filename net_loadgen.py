@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+SKY-SPY-Aware network load generator.
+
+Simulates many remote Sky Spy sensors feeding a server started with
+--listen.  Each sensor opens its own connection (TCP) or socket (UDP)
+and streams newline-delimited detection JSON for drones circling a
+shared centre point.  Optional HTTP pollers hammer aircraft.json at the
+same time to measure serving latency under ingest load.
+
+Usage:
+    python server.py --listen tcp://127.0.0.1:30005 --http-port 8888
+    python net_loadgen.py                                # 100 TCP sensors
+    python net_loadgen.py --sensors 250 --rate 20 --duration 60
+    python net_loadgen.py --target udp://127.0.0.1:30005
+    python net_loadgen.py --rate 0 --pollers 16          # ingest + HTTP benchmark
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import time
+from urllib.parse import urlsplit
+
+from server import parse_listen_spec
+
+CENTER_LAT = 25.78
+CENTER_LON = -80.155
+ORBIT_RADIUS_M = 150.0
+ORBIT_PERIOD_S = 60.0
+
+
+def detection_line(sensor, drone, t):
+    """Build one Sky Spy JSON line for a simulated drone at time t."""
+    phase = 2 * math.pi * (t / ORBIT_PERIOD_S + drone / 7.0 + sensor / 97.0)
+    radius = ORBIT_RADIUS_M + 20 * drone
+    dlat = radius * math.cos(phase) / 111195
+    dlon = radius * math.sin(phase) / (111195 * math.cos(math.radians(CENTER_LAT)))
+    return json.dumps({
+        'mac': f'60:60:1f:{sensor >> 8:02x}:{sensor & 0xff:02x}:{drone:02x}',
+        'rssi': -60 - (sensor + drone) % 30,
+        'drone_lat': round(CENTER_LAT + dlat, 7),
+        'drone_long': round(CENTER_LON + dlon, 7),
+        'drone_altitude': 50 + 10 * drone,
+        'pilot_lat': CENTER_LAT,
+        'pilot_long': CENTER_LON,
+        'basic_id': f'SIM{sensor:04d}D{drone:02d}',
+        'sensor': f'SIM{sensor:04d}',
+    }, separators=(',', ':')) + '\n'
+
+
+async def run_sensor(proto, host, port, sensor, args, stats):
+    """Stream detections from one simulated sensor until the deadline."""
+    interval = 1.0 / args.rate if args.rate > 0 else 0.0
+    deadline = time.monotonic() + args.duration
+    loop = asyncio.get_running_loop()
+    if proto == 'tcp':
+        _, writer = await asyncio.open_connection(host, port)
+        send = writer.write
+    else:
+        transport, _ = await loop.create_datagram_endpoint(
+            asyncio.DatagramProtocol, remote_addr=(host, port))
+        send = transport.sendto
+
+    drone = 0
+    next_send = time.monotonic()
+    while time.monotonic() < deadline:
+        send(detection_line(sensor, drone, time.time()).encode('utf-8'))
+        stats['sent'] += 1
+        drone = (drone + 1) % args.drones
+        if proto == 'tcp':
+            # Respect server backpressure
+            await writer.drain()
+        if not interval:
+            # Unthrottled: let other sensors run between lines
+            await asyncio.sleep(0)
+            continue
+        next_send += interval
+        delay = next_send - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    if proto == 'tcp':
+        writer.close()
+    else:
+        transport.close()
+
+
+async def http_get(host, port, path):
+    """Minimal HTTP/1.0 GET returning the response body."""
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(f'GET {path} HTTP/1.0\r\nHost: {host}\r\n\r\n'.encode('ascii'))
+    response = await reader.read()
+    writer.close()
+    return response.partition(b'\r\n\r\n')[2]
+
+
+async def run_poller(host, port, args, latencies):
+    """Fetch aircraft.json back-to-back until the deadline."""
+    deadline = time.monotonic() + args.duration
+    while time.monotonic() < deadline:
+        started = time.monotonic()
+        await http_get(host, port, '/data/aircraft.json')
+        latencies.append(time.monotonic() - started)
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def main_async(args):
+    proto, host, port = args.target
+    http = urlsplit(args.http)
+    stats = {'sent': 0}
+    latencies = []
+    rate = f"{args.rate:g} lines/s" if args.rate > 0 else "unthrottled"
+    print(f"[LOADGEN] {args.sensors} {proto.upper()} sensors x {rate} "
+          f"-> {host}:{port} for {args.duration}s")
+    if args.pollers:
+        print(f"[LOADGEN] {args.pollers} HTTP pollers -> {args.http}")
+        before = json.loads(await http_get(http.hostname, http.port,
+                                           '/data/aircraft.json'))
+    started = time.monotonic()
+    results = await asyncio.gather(
+        *(run_sensor(proto, host, port, i, args, stats)
+          for i in range(args.sensors)),
+        *(run_poller(http.hostname, http.port, args, latencies)
+          for _ in range(args.pollers)),
+        return_exceptions=True)
+    elapsed = time.monotonic() - started
+    failed = [r for r in results if isinstance(r, Exception)]
+    print(f"[LOADGEN] Sent {stats['sent']} lines in {elapsed:.1f}s "
+          f"({stats['sent'] / elapsed:.0f} lines/s)")
+    if failed:
+        print(f"[LOADGEN] {len(failed)} tasks failed, e.g. {failed[0]!r}")
+
+    if args.pollers and latencies:
+        # Let the server drain its socket buffers before counting
+        await asyncio.sleep(2)
+        after = json.loads(await http_get(http.hostname, http.port,
+                                          '/data/aircraft.json'))
+        ingested = after['messages'] - before['messages']
+        print(f"[LOADGEN] Server ingested {ingested} lines "
+              f"({ingested / elapsed:.0f} lines/s)")
+        print(f"[LOADGEN] HTTP: {len(latencies)} requests "
+              f"({len(latencies) / elapsed:.0f} req/s) | latency ms "
+              f"p50={percentile(latencies, 50) * 1000:.1f} "
+              f"p95={percentile(latencies, 95) * 1000:.1f} "
+              f"p99={percentile(latencies, 99) * 1000:.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Simulate many Sky Spy sensors against --listen')
+    parser.add_argument('--target', type=parse_listen_spec,
+                        default=parse_listen_spec('tcp://127.0.0.1:30005'),
+                        help='Server listen URL (default: tcp://127.0.0.1:30005)')
+    parser.add_argument('--sensors', type=int, default=100,
+                        help='Number of simulated sensors (default: 100)')
+    parser.add_argument('--drones', type=int, default=3,
+                        help='Drones seen by each sensor (default: 3)')
+    parser.add_argument('--rate', type=float, default=10.0,
+                        help='Lines per second per sensor, 0 for as fast as '
+                             'the server accepts (default: 10)')
+    parser.add_argument('--duration', type=float, default=30.0,
+                        help='Seconds to run (default: 30)')
+    parser.add_argument('--pollers', type=int, default=0,
+                        help='Concurrent HTTP clients polling aircraft.json '
+                             '(default: 0)')
+    parser.add_argument('--http', type=str, default='http://127.0.0.1:8888',
+                        help='Server HTTP base URL for pollers '
+                             '(default: http://127.0.0.1:8888)')
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == '__main__':
+    main()
@@ -10,6 +10,15 @@ MessageRateInTitle = false;
 // Use metric for drones (meters, km, km/h)
 DisplayUnits = "metric";
 
+// -- Dead reckoning --------------------------------------
+// Between polls, move drone markers along the server-reported
+// speed/heading so the map stays smooth with a slow refresh.
+ExtrapolatePositions = true;
+// Never project a drone more than this many seconds past its last fix
+ExtrapolateMaxSeconds = 10;
+// Marker animation interval (ms)
+ExtrapolateInterval = 250;
+
 // -- Map settings ----------------------------------------
 // Default center: Miami area (from sample drone detection data)
 DefaultCenterLat = 25.78;
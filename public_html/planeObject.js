@@ -21,6 +21,7 @@ function PlaneObject(icao) {
     this.prev_position = null;
     this.prev_position_time = null;
     this.position  = null;
+    this.position_local_time = null;   // browser clock (s) of the last fix
     this.position_from_mlat = false;
     this.sitedist  = null;
 
@@ -59,6 +60,7 @@ function PlaneObject(icao) {
     this.pilot_lon = null;
     this.altitude_m = null;
     this.drone_hex = null;    // For pilot entries: hex of parent drone
+    this.sensor = null;       // Remote sensor ID ('' for the local serial port)
 
     // Unused but kept for compatibility with SkyAware code paths
     this.registration = null;
@@ -116,6 +118,7 @@ PlaneObject.prototype.updateData = function(now, data) {
     if ('pilot_lat' in data) this.pilot_lat = data.pilot_lat;
     if ('pilot_long' in data) this.pilot_lon = data.pilot_long;
     if ('drone_hex' in data) this.drone_hex = data.drone_hex;
+    if ('sensor' in data) this.sensor = data.sensor;
 
     if ('flight' in data) this.flight = data.flight;
     if ('squawk' in data) this.squawk = data.squawk;
@@ -141,6 +144,9 @@ PlaneObject.prototype.updateData = function(now, data) {
     if ('lat' in data && 'lon' in data) {
         this.position = [data.lon, data.lat];
         this.last_position_time = now;
+        // Anchor dead reckoning to the browser clock so server/client
+        // clock skew doesn't push the marker forwards or backwards
+        this.position_local_time = Date.now() / 1000 - (data.seen_pos || 0);
 
         if (SitePosition !== null) {
             var dlat = this.position[1] - SitePosition[1];
@@ -154,6 +160,24 @@ PlaneObject.prototype.updateTick = function(now, last_timestamp) {
     // nothing needed for simple drone display
 };
 
+// Estimated current position: the last fix projected along gs/track.
+// Falls back to the raw fix when there is no usable velocity.
+PlaneObject.prototype.getDisplayPosition = function() {
+    if (!this.position) return null;
+    if (!ExtrapolatePositions || this.droneType !== 'drone') return this.position;
+    if (this.gs === null || this.track === null || this.position_local_time === null) return this.position;
+
+    var dt = Date.now() / 1000 - this.position_local_time;
+    if (dt <= 0) return this.position;
+    if (dt > ExtrapolateMaxSeconds) dt = ExtrapolateMaxSeconds;
+
+    var dist = this.gs / 1.943844 * dt;  // knots -> m/s -> m
+    var trk = this.track * Math.PI / 180;
+    var dlat = dist * Math.cos(trk) / 111195;
+    var dlon = dist * Math.sin(trk) / (111195 * Math.cos(this.position[1] * Math.PI / 180));
+    return [this.position[0] + dlon, this.position[1] + dlat];
+};
+
 PlaneObject.prototype.updateTrack = function(now, last_timestamp) {
     if (!this.position) return;
     if (this.prev_position && this.position[0] == this.prev_position[0] && this.position[1] == this.prev_position[1]) {
@@ -248,13 +272,13 @@ PlaneObject.prototype.updateMarker = function(moved) {
 
     if (this.marker) {
         if (moved) {
-            this.marker.setGeometry(new ol.geom.Point(ol.proj.fromLonLat(this.position)));
+            this.marker.setGeometry(new ol.geom.Point(ol.proj.fromLonLat(this.getDisplayPosition())));
         }
         this.updateIcon();
         return;
     }
 
-    this.marker = new ol.Feature(new ol.geom.Point(ol.proj.fromLonLat(this.position)));
+    this.marker = new ol.Feature(new ol.geom.Point(ol.proj.fromLonLat(this.getDisplayPosition())));
     this.marker.hex = this.icao;
     this.updateIcon();
     PlaneIconFeatures.push(this.marker);
@@ -153,7 +153,7 @@ function updatePilotLines() {
         if (drone.pilot_lat === null || drone.pilot_lon === null) continue;
         if (drone.pilot_lat === 0 && drone.pilot_lon === 0) continue;
 
-        var droneCoord = ol.proj.fromLonLat(drone.position);
+        var droneCoord = ol.proj.fromLonLat(drone.getDisplayPosition());
         var pilotCoord = ol.proj.fromLonLat([drone.pilot_lon, drone.pilot_lat]);
 
         var lineFeature = new ol.Feature(new ol.geom.LineString([droneCoord, pilotCoord]));
@@ -285,6 +285,9 @@ function initialize() {
         cache: false,
         dataType: 'json'
     }).done(function(data) {
+        if (data.refresh) {
+            RefreshInterval = data.refresh;
+        }
         if (data.lat !== undefined && data.lat !== 0) {
             SitePosition = [data.lon, data.lat];
             CenterLat = data.lat;
@@ -370,6 +373,24 @@ function start_updating() {
     window.setInterval(fetchData, RefreshInterval);
     window.setInterval(fetchActivity, RefreshInterval);
     window.setInterval(refreshClock, 500);
+    if (ExtrapolatePositions) {
+        window.setInterval(extrapolateMarkers, ExtrapolateInterval);
+    }
+}
+
+// Dead-reckon moving drones between polls
+function extrapolateMarkers() {
+    var moved = false;
+    for (var i = 0; i < PlanesOrdered.length; i++) {
+        var plane = PlanesOrdered[i];
+        if (plane.droneType !== 'drone' || !plane.marker) continue;
+        if (plane.gs === null || plane.track === null) continue;
+        plane.updateMarker(true);
+        moved = true;
+    }
+    if (moved) {
+        updatePilotLines();
+    }
 }
 
 function fetchActivity() {
@@ -532,6 +553,7 @@ function refreshSelected() {
     $('#selected_mac').text(sel.mac || sel.icao);
     $('#selected_manufacturer').text(sel.manufacturer || 'Unknown');
     $('#selected_source').text(sel.droneType === 'drone' ? 'Drone (Open Drone ID)' : sel.droneType === 'pilot' ? 'Pilot' : 'Unknown');
+    $('#selected_sensor').text(sel.sensor || 'Local');
     $('#selected_rssi').text(sel.rssi !== null ? sel.rssi + ' dBm' : 'n/a');
     $('#selected_message_count').text(sel.messages || 0);
     $('#selected_seen').text(sel.seen !== null ? sel.seen.toFixed(1) + 's ago' : 'n/a');
@@ -550,6 +572,10 @@ function refreshSelected() {
         $('#selected_altitude').text('n/a');
     }
 
+    $('#selected_speed').text(format_speed_long(sel.gs, DisplayUnits));
+    $('#selected_track').text(format_track_long(sel.track));
+    $('#selected_vert_rate').text(format_vert_rate_long(sel.vert_rate, DisplayUnits));
+
     // Pilot info
     if (sel.pilot_lat !== null && sel.pilot_lon !== null && (sel.pilot_lat !== 0 || sel.pilot_lon !== 0)) {
         $('#selected_pilot_position').text(sel.pilot_lat.toFixed(6) + ', ' + sel.pilot_lon.toFixed(6));
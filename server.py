@@ -11,17 +11,26 @@ Usage:
     python server.py --port COM5              # Specify serial port
     python server.py --replay logfile.txt     # Replay a saved serial log
     python server.py --replay logfile.txt --fast  # Instant replay
+    python server.py --listen tcp://0.0.0.0:30005  # Remote sensors over TCP
+    python server.py --workers 4              # HTTP in 4 worker processes
 """
 
 import argparse
+import asyncio
 import collections
 import datetime
 import hashlib
 import json
+import math
+import multiprocessing
 import os
+import signal
+import socket
+import struct
 import sys
 import threading
 import time
+import zlib
 from http.server import HTTPServer, SimpleHTTPRequestHandler
 from pathlib import Path
 
@@ -31,6 +40,11 @@ try:
 except ImportError:
     serial = None
 
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Python < 3.8
+    shared_memory = None
+
 from oui_database import oui_lookup
 
 # ---------------------------------------------------------------------------
@@ -41,6 +55,32 @@ SERIAL_BAUD = 115200
 DRONE_TIMEOUT_S = 60          # Remove drones not seen for this many seconds
 REPLAY_LINE_DELAY = 0.1       # Seconds between lines in replay mode
 REPLAY_BURST_PAUSE = 2.0      # Pause between detection bursts
+REFRESH_MS = 1000             # Dashboard poll interval advertised in receiver.json
+
+# Network ingest (--listen)
+NET_MAX_LINE = 4096           # Longest accepted line; longer ones are dropped
+NET_YIELD_EVERY = 64          # Lines handled per connection before yielding
+NET_STATS_INTERVAL_S = 10     # Seconds between ingest summaries
+
+# Multi-process serving (--workers)
+PUBLISH_INTERVAL_S = 0.25     # How often the ingest process publishes snapshots
+SHM_AIRCRAFT_BYTES = 4 << 20  # Largest aircraft.json snapshot that can be shared
+SHM_ACTIVITY_BYTES = 1 << 20  # Largest encoded activity snapshot
+SHM_READ_RETRIES = 100        # Reader retries before giving up on a snapshot
+RESTART_TIMEOUT_S = 5         # How long a worker waits for a restart result
+
+# Kinematics (speed / heading / vertical rate from successive positions)
+KIN_MIN_DT_S = 0.5            # Ignore fixes closer together than this
+KIN_MAX_DT_S = 15.0           # Restart estimation after a gap this long
+KIN_MAX_SPEED_MS = 60.0       # Implied speeds above this are outliers
+KIN_MAX_VRATE_MS = 30.0       # Implied climb/sink rates above this are outliers
+KIN_MAX_OUTLIERS = 3          # Consecutive outliers before re-anchoring
+KIN_SMOOTHING = 0.5           # EMA weight given to the newest velocity sample
+KIN_MIN_TRACK_SPEED_MS = 0.5  # Below this the heading is noise — don't report it
+KIN_STALE_S = 10.0            # Stop reporting velocity after this long without a fix
+EARTH_RADIUS_M = 6371000.0
+MS_TO_KNOTS = 1.943844
+MS_TO_FPM = 196.8504
 
 # ---------------------------------------------------------------------------
 # Global state
@@ -51,6 +91,7 @@ activity_lines = collections.deque(maxlen=200)  # recent raw serial lines with s
 activity_seq = 0        # monotonic sequence counter
 activity_lock = threading.Lock()
 active_reader = None    # reference to SerialReader for restart
+refresh_ms = REFRESH_MS # poll interval served in receiver.json (--refresh)
 start_time = time.time()
 server_start = time.time()
 
@@ -79,6 +120,10 @@ def serial_autodetect():
 # ---------------------------------------------------------------------------
 # Drone data processing
 # ---------------------------------------------------------------------------
+NUMERIC_FIELDS = ('drone_lat', 'drone_long', 'drone_altitude',
+                  'pilot_lat', 'pilot_long', 'rssi')
+
+
 def parse_drone_json(line):
     """Parse a Sky Spy JSON detection line. Returns dict or None."""
     line = line.strip()
@@ -86,11 +131,31 @@ def parse_drone_json(line):
         return None
     try:
         data = json.loads(line)
-        if 'mac' in data and 'drone_lat' in data:
-            return data
     except (json.JSONDecodeError, ValueError):
-        pass
-    return None
+        return None
+    if not isinstance(data, dict):
+        return None
+    # Treat nulls as missing, and reject non-numeric or non-finite
+    # positions so one bad line (e.g. from a remote sensor) can't poison
+    # the drone state
+    data = {k: v for k, v in data.items() if v is not None}
+    if 'mac' not in data or 'drone_lat' not in data:
+        return None
+    for field in NUMERIC_FIELDS:
+        value = data.get(field, 0)
+        # json.loads accepts NaN/Infinity, and bool is an int subclass
+        if (isinstance(value, bool) or not isinstance(value, (int, float))
+                or not math.isfinite(value)):
+            return None
+    return data
+
+
+def record_activity(text):
+    """Append a raw input line to the activity buffer."""
+    global activity_seq
+    with activity_lock:
+        activity_seq += 1
+        activity_lines.append((activity_seq, text))
 
 
 def get_drone_key(data):
@@ -101,6 +166,86 @@ def get_drone_key(data):
     return data.get('mac', 'unknown')
 
 
+def _kin_anchor(mac, lat, lon, alt, now, ve=None, vn=None, vu=None):
+    return {'mac': mac, 'lat': lat, 'lon': lon, 'alt': alt, 't': now,
+            've': ve, 'vn': vn, 'vu': vu, 'outliers': 0}
+
+
+def update_kinematics(d, mac, lat, lon, alt, now, moved):
+    """Fold a new position fix into the drone's velocity estimate.
+
+    Velocity is kept as smoothed east/north/up components (m/s) so that
+    heading averaging doesn't wrap at 360.  The estimate follows a single
+    MAC: only a MAC that has itself reported a changed position
+    (``moved``) can take it over, so the first, possibly frozen, fix from
+    an AP beacon never counts.  Repeats of the same position from the
+    owning MAC are zero-velocity samples, so a hovering drone slows to a
+    stop.  A fix that implies an impossible (or non-finite) speed or
+    climb rate is an outlier and is dropped; after KIN_MAX_OUTLIERS in a
+    row the drone has genuinely relocated, so estimation restarts from
+    the new fix.
+
+    Returns True if the fix was accepted as the drone's current position.
+    """
+    kin = d.get('_kin')
+    if kin is None or now - kin['t'] > KIN_MAX_DT_S:
+        d['_kin'] = _kin_anchor(mac, lat, lon, alt, now)
+        return True
+    if mac != kin['mac']:
+        if not moved:
+            return False
+        # This MAC is producing live position changes — hand over to it
+        d['_kin'] = _kin_anchor(mac, lat, lon, alt, now,
+                                kin['ve'], kin['vn'], kin['vu'])
+        return True
+    dt = now - kin['t']
+    if dt < KIN_MIN_DT_S:
+        return True
+
+    # Equirectangular approximation — plenty for drone-scale distances
+    lat_rad = math.radians((lat + kin['lat']) / 2)
+    east = math.radians(lon - kin['lon']) * math.cos(lat_rad) * EARTH_RADIUS_M
+    north = math.radians(lat - kin['lat']) * EARTH_RADIUS_M
+    ve, vn, vu = east / dt, north / dt, (alt - kin['alt']) / dt
+
+    # NaN compares False against the limits, so check finiteness explicitly
+    if (not all(map(math.isfinite, (ve, vn, vu)))
+            or math.hypot(ve, vn) > KIN_MAX_SPEED_MS
+            or abs(vu) > KIN_MAX_VRATE_MS):
+        kin['outliers'] += 1
+        if (kin['outliers'] >= KIN_MAX_OUTLIERS
+                and all(map(math.isfinite, (lat, lon, alt)))):
+            d['_kin'] = _kin_anchor(mac, lat, lon, alt, now)
+            return True
+        return False
+
+    if kin['ve'] is None:
+        kin['ve'], kin['vn'], kin['vu'] = ve, vn, vu
+    else:
+        a = KIN_SMOOTHING
+        kin['ve'] += a * (ve - kin['ve'])
+        kin['vn'] += a * (vn - kin['vn'])
+        kin['vu'] += a * (vu - kin['vu'])
+    kin.update(lat=lat, lon=lon, alt=alt, t=now, outliers=0)
+    return True
+
+
+def kinematics_fields(d, now):
+    """Return SkyAware gs (kt) / track (deg) / baro_rate (ft/min) for a drone."""
+    kin = d.get('_kin')
+    if kin is None or kin['ve'] is None or now - kin['t'] > KIN_STALE_S:
+        return {'gs': None, 'track': None, 'baro_rate': None}
+    speed = math.hypot(kin['ve'], kin['vn'])
+    track = None
+    if speed >= KIN_MIN_TRACK_SPEED_MS:
+        track = round(math.degrees(math.atan2(kin['ve'], kin['vn'])) % 360, 1)
+    return {
+        'gs': round(speed * MS_TO_KNOTS, 1),
+        'track': track,
+        'baro_rate': round(kin['vu'] * MS_TO_FPM),
+    }
+
+
 def update_drone(data):
     """Update the in-memory drone dict with a new detection."""
     key = get_drone_key(data)
@@ -108,6 +253,7 @@ def update_drone(data):
     now = time.time()
     new_lat = data.get('drone_lat', 0.0)
     new_lon = data.get('drone_long', 0.0)
+    new_alt = data.get('drone_altitude', 0)
     with drones_lock:
         if key not in drones:
             drones[key] = {'_mac_pos': {}}
@@ -116,24 +262,28 @@ def update_drone(data):
         d['mac'] = mac
         d['rssi'] = data.get('rssi', 0)
 
-        # Only update position when this MAC reports a CHANGED position.
+        # Only follow the MAC that reports CHANGING positions.
         # The spoofer transmits on two MACs (AP beacon + NAN frames).
         # The AP beacon vendor IE can carry stale/frozen position data
         # while NAN frames carry the correct live position.  Without
         # this check the stale AP beacon data (which fires ~10x more
         # often) overwrites the fresh NAN position every cycle.
+        # update_kinematics() decides which MAC owns the position.
         mac_pos = d.get('_mac_pos', {})
         prev = mac_pos.get(mac)
-        if prev is None or prev[0] != new_lat or prev[1] != new_lon:
+        moved = prev is not None and (prev[0] != new_lat or prev[1] != new_lon)
+        mac_pos[mac] = (new_lat, new_lon)
+        d['_mac_pos'] = mac_pos
+        if update_kinematics(d, mac, new_lat, new_lon, new_alt, now, moved):
             d['drone_lat'] = new_lat
             d['drone_long'] = new_lon
-            mac_pos[mac] = (new_lat, new_lon)
-            d['_mac_pos'] = mac_pos
+            d['_pos_time'] = now
 
-        d['drone_altitude'] = data.get('drone_altitude', 0)
+        d['drone_altitude'] = new_alt
         d['pilot_lat'] = data.get('pilot_lat', 0.0)
         d['pilot_long'] = data.get('pilot_long', 0.0)
         d['basic_id'] = data.get('basic_id', '')
+        d['sensor'] = data.get('sensor', '')
         d['last_seen'] = now
         d['detections'] = d.get('detections', 0) + 1
 
@@ -179,6 +329,7 @@ def build_aircraft_json():
         for key, d in drones.items():
             hex_id = drone_key_to_hex(key)
             seen = now - d.get('last_seen', now)
+            seen_pos = now - d.get('_pos_time', d.get('last_seen', now))
             total_messages += d.get('detections', 0)
 
             # Drone entry
@@ -195,14 +346,16 @@ def build_aircraft_json():
                 'lon': d.get('drone_long', 0.0),
                 'rssi': d.get('rssi', 0),
                 'seen': round(seen, 1),
-                'seen_pos': round(seen, 1),
+                'seen_pos': round(seen_pos, 1),
                 'messages': d.get('detections', 1),
                 'mac': d.get('mac', ''),
                 'manufacturer': oui_lookup(d.get('mac', '')),
                 'altitude_m': drone_alt_m,
                 'pilot_lat': d.get('pilot_lat', 0.0),
                 'pilot_long': d.get('pilot_long', 0.0),
+                'sensor': d.get('sensor', ''),
             }
+            drone_entry.update(kinematics_fields(d, now))
             aircraft.append(drone_entry)
 
             # Pilot entry (only if pilot position is non-zero)
@@ -338,10 +491,7 @@ class SerialReader(threading.Thread):
                     # Store in activity buffer
                     stripped = line.strip()
                     if stripped:
-                        global activity_seq
-                        with activity_lock:
-                            activity_seq += 1
-                            activity_lines.append((activity_seq, stripped))
+                        record_activity(stripped)
                     # Write every raw line to log
                     if self.log_file:
                         self.log_file.write(line)
@@ -392,10 +542,7 @@ class ReplayReader(threading.Thread):
         for line in lines:
             stripped = line.strip()
             if stripped:
-                global activity_seq
-                with activity_lock:
-                    activity_seq += 1
-                    activity_lines.append((activity_seq, stripped))
+                record_activity(stripped)
             data = parse_drone_json(line)
             if data:
                 update_drone(data)
@@ -425,6 +572,134 @@ class ReplayReader(threading.Thread):
             time.sleep(10)
 
 
+# ---------------------------------------------------------------------------
+# Network reader thread
+# ---------------------------------------------------------------------------
+class _UDPSensorProtocol(asyncio.DatagramProtocol):
+    """Each datagram carries one or more newline-delimited JSON lines."""
+
+    def __init__(self, reader):
+        self.reader = reader
+
+    def datagram_received(self, data, addr):
+        sensor_id = addr[0]
+        for line in data.split(b'\n'):
+            if len(line) <= NET_MAX_LINE:
+                self.reader.ingest(line, sensor_id)
+
+
+class NetworkReader(threading.Thread):
+    """Accept Sky Spy JSON lines from remote sensors over TCP and/or UDP.
+
+    Runs an asyncio event loop in its own thread.  Each TCP connection is
+    a coroutine reading whole lines from a bounded StreamReader; once its
+    buffer fills the transport stops reading, so a fast sensor is
+    throttled by TCP flow control instead of growing memory.  Every
+    detection is tagged with the sensor it came from — the ``sensor``
+    field if the sensor sends one, otherwise its IP address (the source
+    port changes on every reconnect, so it isn't part of the ID).
+    """
+
+    def __init__(self, endpoints):
+        super().__init__(daemon=True)
+        self.endpoints = endpoints    # list of (proto, host, port)
+        self.connections = 0
+        self.lines = 0
+        self.detections = 0
+
+    def ingest(self, raw, sensor_id):
+        """Feed one raw line through the normal parse/update path."""
+        stripped = raw.decode('utf-8', errors='replace').strip()
+        if not stripped:
+            return
+        self.lines += 1
+        try:
+            record_activity(f'[{sensor_id}] {stripped}')
+            data = parse_drone_json(stripped)
+            if data:
+                if not data.get('sensor'):
+                    data['sensor'] = sensor_id
+                update_drone(data)
+                self.detections += 1
+        except Exception as e:
+            # One malformed line must not drop the sensor's stream
+            print(f"[NET] Bad line from {sensor_id}: {e!r}")
+
+    async def _handle_tcp(self, reader, writer):
+        peer = writer.get_extra_info('peername')
+        sensor_id = peer[0] if peer else 'tcp'
+        self.connections += 1
+        print(f"[NET] Sensor connected: {sensor_id} "
+              f"({self.connections} active)")
+        handled = 0
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Line exceeded NET_MAX_LINE; the buffer was discarded
+                    continue
+                if not line:
+                    break
+                self.ingest(line, sensor_id)
+                # readline() doesn't yield while data is buffered, so give
+                # other connections a turn now and then
+                handled += 1
+                if handled % NET_YIELD_EVERY == 0:
+                    await asyncio.sleep(0)
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+            print(f"[NET] Sensor disconnected: {sensor_id} "
+                  f"({self.connections} active)")
+
+    async def _report_stats(self):
+        last_lines = 0
+        while True:
+            await asyncio.sleep(NET_STATS_INTERVAL_S)
+            if self.lines != last_lines:
+                rate = (self.lines - last_lines) / NET_STATS_INTERVAL_S
+                print(f"[NET] {self.connections} TCP sensors | "
+                      f"{rate:.0f} lines/s | "
+                      f"{self.detections} detections total")
+                last_lines = self.lines
+
+    async def _serve(self):
+        loop = asyncio.get_running_loop()
+        listening = 0
+        for proto, host, port in self.endpoints:
+            try:
+                if proto == 'tcp':
+                    await asyncio.start_server(self._handle_tcp, host, port,
+                                               limit=NET_MAX_LINE)
+                else:
+                    await loop.create_datagram_endpoint(
+                        lambda: _UDPSensorProtocol(self),
+                        local_addr=(host, port))
+            except OSError as e:
+                print(f"[NET] Cannot listen on {proto}://{host}:{port}: {e}")
+                continue
+            listening += 1
+            print(f"[NET] Listening on {proto}://{host}:{port}")
+        if listening:
+            await self._report_stats()
+
+    def run(self):
+        asyncio.run(self._serve())
+
+
+def parse_listen_spec(spec):
+    """Parse a --listen value like tcp://0.0.0.0:30005 into (proto, host, port)."""
+    proto, sep, rest = spec.partition('://')
+    host, _, port = rest.rpartition(':')
+    if not sep or proto not in ('tcp', 'udp') or not port.isdigit():
+        raise argparse.ArgumentTypeError(
+            f"expected tcp://HOST:PORT or udp://HOST:PORT, got '{spec}'")
+    return proto, host.strip('[]') or '0.0.0.0', int(port)
+
+
 # ---------------------------------------------------------------------------
 # HTTP server
 # ---------------------------------------------------------------------------
@@ -444,13 +719,13 @@ class SkySpyHandler(SimpleHTTPRequestHandler):
         if path == '/data/receiver.json':
             self.send_json_response({
                 'version': 'SKY-SPY-Aware v1.0',
-                'refresh': 1000,
+                'refresh': refresh_ms,
                 'history': 0,
                 'lat': 0,
                 'lon': 0,
             })
         elif path == '/data/aircraft.json':
-            self.send_json_response(build_aircraft_json())
+            self.send_json_bytes(self.aircraft_payload())
         elif path == '/data/activity.json':
             # Support ?since=N to only return lines after seq N
             since = 0
@@ -462,11 +737,7 @@ class SkySpyHandler(SimpleHTTPRequestHandler):
                             since = int(param[6:])
                         except ValueError:
                             pass
-            with activity_lock:
-                if since > 0:
-                    new_lines = [(s, t) for s, t in activity_lines if s > since]
-                else:
-                    new_lines = list(activity_lines)
+            new_lines = self.activity_since(since)
             self.send_json_response({
                 'lines': [{'seq': s, 'text': t} for s, t in new_lines]
             })
@@ -474,8 +745,29 @@ class SkySpyHandler(SimpleHTTPRequestHandler):
             # Serve static files
             super().do_GET()
 
+    def aircraft_payload(self):
+        """Encoded aircraft.json body."""
+        return json.dumps(build_aircraft_json()).encode('utf-8')
+
+    def activity_since(self, since):
+        """Activity lines as (seq, text) pairs newer than seq ``since``."""
+        with activity_lock:
+            if since > 0:
+                return [(s, t) for s, t in activity_lines if s > since]
+            return list(activity_lines)
+
+    def restart_sensor(self):
+        """Reset the live sensor. Returns the JSON reply for the client."""
+        if active_reader and hasattr(active_reader, 'restart_device'):
+            if active_reader.restart_device():
+                return {'status': 'ok', 'message': 'Sensor restarting'}
+            return {'status': 'error', 'message': 'Serial port not available'}
+        return {'status': 'error', 'message': 'No live serial connection (replay mode?)'}
+
     def send_json_response(self, data):
-        content = json.dumps(data).encode('utf-8')
+        self.send_json_bytes(json.dumps(data).encode('utf-8'))
+
+    def send_json_bytes(self, content):
         self.send_response(200)
         self.send_header('Content-Type', 'application/json')
         self.send_header('Content-Length', len(content))
@@ -488,14 +780,7 @@ class SkySpyHandler(SimpleHTTPRequestHandler):
         path = self.path.split('?')[0]
 
         if path == '/api/restart-sensor':
-            if active_reader and hasattr(active_reader, 'restart_device'):
-                ok = active_reader.restart_device()
-                if ok:
-                    self.send_json_response({'status': 'ok', 'message': 'Sensor restarting'})
-                else:
-                    self.send_json_response({'status': 'error', 'message': 'Serial port not available'})
-            else:
-                self.send_json_response({'status': 'error', 'message': 'No live serial connection (replay mode?)'})
+            self.send_json_response(self.restart_sensor())
         else:
             self.send_error(404)
 
@@ -505,6 +790,314 @@ class SkySpyHandler(SimpleHTTPRequestHandler):
             super().log_message(format, *args)
 
 
+# ---------------------------------------------------------------------------
+# Multi-process serving over shared memory
+# ---------------------------------------------------------------------------
+class SnapshotBuffer:
+    """A double-buffered byte snapshot in shared memory.
+
+    Layout: a header (seq, active slot, slot size) followed by two equal
+    slots, each holding (length, crc32) and the payload.  The single
+    writer fills the inactive slot and then points the header at it.  Nothing orders
+    those stores on weakly ordered CPUs (ARM), so readers don't trust
+    the header: they copy the active slot and only return it if its
+    length and crc32 check out and seq hasn't moved, retrying otherwise.
+    Readers never block the writer.
+    """
+    HEADER = struct.Struct('<QII')
+    SLOT_HEADER = struct.Struct('<II')
+
+    def __init__(self, shm, owner=False):
+        self.shm = shm
+        self.owner = owner
+        # Stored, not derived from shm.size: some platforms round that up
+        self.slot_size = self.HEADER.unpack_from(shm.buf, 0)[2]
+        self.capacity = self.slot_size - self.SLOT_HEADER.size
+
+    @classmethod
+    def create(cls, capacity):
+        slot_size = cls.SLOT_HEADER.size + capacity
+        shm = shared_memory.SharedMemory(
+            create=True, size=cls.HEADER.size + 2 * slot_size)
+        cls.HEADER.pack_into(shm.buf, 0, 0, 0, slot_size)
+        for slot in range(2):
+            cls.SLOT_HEADER.pack_into(
+                shm.buf, cls.HEADER.size + slot * slot_size, 0, zlib.crc32(b''))
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name):
+        return cls(shared_memory.SharedMemory(name=name))
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def publish(self, payload):
+        """Make ``payload`` the current snapshot. False if it doesn't fit."""
+        if len(payload) > self.capacity:
+            return False
+        buf = self.shm.buf
+        seq, slot, _ = self.HEADER.unpack_from(buf, 0)
+        nxt = 1 - slot
+        offset = self.HEADER.size + nxt * self.slot_size
+        self.SLOT_HEADER.pack_into(buf, offset, len(payload), zlib.crc32(payload))
+        start = offset + self.SLOT_HEADER.size
+        buf[start:start + len(payload)] = payload
+        self.HEADER.pack_into(buf, 0, seq + 1, nxt, self.slot_size)
+        return True
+
+    def read(self):
+        """Return a verified copy of the current snapshot, or None."""
+        buf = self.shm.buf
+        for _ in range(SHM_READ_RETRIES):
+            seq, slot, _ = self.HEADER.unpack_from(buf, 0)
+            if slot in (0, 1):
+                offset = self.HEADER.size + slot * self.slot_size
+                length, crc = self.SLOT_HEADER.unpack_from(buf, offset)
+                if length <= self.capacity:
+                    start = offset + self.SLOT_HEADER.size
+                    data = bytes(buf[start:start + length])
+                    if (zlib.crc32(data) == crc
+                            and self.HEADER.unpack_from(buf, 0)[0] == seq):
+                        return data
+            time.sleep(0)
+        return None
+
+    def close(self):
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def encode_activity(lines, limit):
+    """Pack (seq, text) pairs as 'seq\\ttext' lines, dropping the oldest to fit."""
+    encoded = [f'{seq}\t{text}'.encode('utf-8') for seq, text in lines]
+    total = sum(len(e) + 1 for e in encoded)
+    start = 0
+    while total > limit and start < len(encoded):
+        total -= len(encoded[start]) + 1
+        start += 1
+    return b'\n'.join(encoded[start:])
+
+
+def decode_activity(payload, since):
+    """Unpack encode_activity() output, keeping lines newer than ``since``."""
+    lines = []
+    for raw in payload.split(b'\n'):
+        seq, sep, text = raw.partition(b'\t')
+        if sep and int(seq) > since:
+            lines.append((int(seq), text.decode('utf-8', errors='replace')))
+    return lines
+
+
+class RestartChannel:
+    """Lets HTTP workers ask the ingest process to restart the sensor.
+
+    A worker sets ``requested`` and waits on ``done``; the publisher
+    thread runs restart_device() and hands the result back in ``ok``.
+    """
+
+    def __init__(self, ctx):
+        self.requested = ctx.Event()
+        self.done = ctx.Event()
+        self.ok = ctx.Value('b', 0, lock=False)
+        self.lock = ctx.Lock()     # one restart in flight at a time
+
+    def request(self):
+        """Ask for a restart. Returns True/False, or None on timeout."""
+        with self.lock:
+            self.done.clear()
+            self.requested.set()
+            if not self.done.wait(RESTART_TIMEOUT_S):
+                self.requested.clear()
+                return None
+            return bool(self.ok.value)
+
+    def serve(self):
+        """Run a pending restart request, if any (ingest process side)."""
+        if not self.requested.is_set():
+            return False
+        self.requested.clear()
+        self.ok.value = False
+        try:
+            self.ok.value = bool(active_reader and active_reader.restart_device())
+        finally:
+            self.done.set()
+        return True
+
+
+class SnapshotPublisher(threading.Thread):
+    """Publish drone and activity snapshots for the HTTP worker processes.
+
+    Runs in the ingest process.  aircraft.json is encoded here once per
+    PUBLISH_INTERVAL_S instead of once per request.  Workers can't reach
+    the SerialReader, so restart requests arrive over a RestartChannel.
+    """
+
+    def __init__(self, aircraft_buf, activity_buf, restart):
+        super().__init__(daemon=True)
+        self.aircraft_buf = aircraft_buf
+        self.activity_buf = activity_buf
+        self.restart = restart
+
+    def run(self):
+        published_seq = None
+        warned = False
+        while True:
+            try:
+                if self.restart.serve():
+                    published_seq = None
+
+                payload = json.dumps(build_aircraft_json()).encode('utf-8')
+                if not self.aircraft_buf.publish(payload):
+                    if not warned:
+                        print(f"[SHM] aircraft.json snapshot ({len(payload)} "
+                              f"bytes) exceeds buffer; serving the previous one")
+                        warned = True
+
+                with activity_lock:
+                    seq = activity_seq
+                    lines = list(activity_lines) if seq != published_seq else None
+                if lines is not None:
+                    self.activity_buf.publish(
+                        encode_activity(lines, self.activity_buf.capacity))
+                    published_seq = seq
+            except Exception as e:
+                # Keep publishing — a dead thread would freeze every client
+                print(f"[SHM] Publish failed: {e!r}")
+
+            # Wake early for a restart request so the worker isn't kept waiting
+            self.restart.requested.wait(PUBLISH_INTERVAL_S)
+
+
+class SnapshotHandler(SkySpyHandler):
+    """SkySpyHandler that serves published snapshots instead of live state."""
+
+    aircraft_buf = None
+    activity_buf = None
+    restart = None
+    restart_supported = False
+
+    def aircraft_payload(self):
+        payload = self.aircraft_buf.read()
+        if not payload:
+            return json.dumps({'now': time.time(), 'messages': 0,
+                               'aircraft': []}).encode('utf-8')
+        return payload
+
+    def activity_since(self, since):
+        payload = self.activity_buf.read()
+        if not payload:
+            return []
+        return decode_activity(payload, since)
+
+    def restart_sensor(self):
+        if not self.restart_supported:
+            return {'status': 'error', 'message': 'No live serial connection (replay mode?)'}
+        ok = self.restart.request()
+        if ok is None:
+            return {'status': 'error', 'message': 'Sensor restart timed out'}
+        if ok:
+            return {'status': 'ok', 'message': 'Sensor restarting'}
+        return {'status': 'error', 'message': 'Serial port not available'}
+
+
+def http_worker(sock, aircraft_name, activity_name, restart,
+                restart_supported, refresh):
+    """Entry point of an HTTP worker process."""
+    global refresh_ms
+    refresh_ms = refresh
+    SnapshotHandler.aircraft_buf = SnapshotBuffer.attach(aircraft_name)
+    SnapshotHandler.activity_buf = SnapshotBuffer.attach(activity_name)
+    SnapshotHandler.restart = restart
+    SnapshotHandler.restart_supported = restart_supported
+
+    # All workers accept() on the socket inherited from the parent
+    httpd = HTTPServer(sock.getsockname(), SnapshotHandler,
+                       bind_and_activate=False)
+    httpd.socket.close()
+    httpd.socket = sock
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+def _raise_keyboard_interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+
+def start_snapshots(ctx):
+    """Create the snapshot buffers and start publishing into them."""
+    aircraft_buf = SnapshotBuffer.create(SHM_AIRCRAFT_BYTES)
+    activity_buf = SnapshotBuffer.create(SHM_ACTIVITY_BYTES)
+    restart = RestartChannel(ctx)
+    SnapshotPublisher(aircraft_buf, activity_buf, restart).start()
+    return aircraft_buf, activity_buf, restart
+
+
+def serve_snapshot_cache(http_port):
+    """Single-process serving from the same snapshots --workers uses.
+
+    Isolates the effect of pre-encoding aircraft.json from that of
+    moving HTTP into separate processes when benchmarking.
+    """
+    # SIGTERM (timeout, service managers) must still run the cleanup below
+    signal.signal(signal.SIGTERM, _raise_keyboard_interrupt)
+    aircraft_buf, activity_buf, restart = start_snapshots(
+        multiprocessing.get_context('spawn'))
+    SnapshotHandler.aircraft_buf = aircraft_buf
+    SnapshotHandler.activity_buf = activity_buf
+    SnapshotHandler.restart = restart
+    SnapshotHandler.restart_supported = hasattr(active_reader, 'restart_device')
+    print("[HTTP] Serving snapshots encoded every "
+          f"{PUBLISH_INTERVAL_S}s (single process)")
+
+    httpd = HTTPServer(('0.0.0.0', http_port), SnapshotHandler)
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        print("\n[SERVER] Shutting down...")
+    finally:
+        httpd.server_close()
+        aircraft_buf.close()
+        activity_buf.close()
+
+
+def serve_workers(http_port, workers):
+    """Serve HTTP from worker processes while this process does ingest."""
+    # spawn, not fork: the reader threads are already running here
+    ctx = multiprocessing.get_context('spawn')
+    # SIGTERM (timeout, service managers) must still run the cleanup below
+    signal.signal(signal.SIGTERM, _raise_keyboard_interrupt)
+    aircraft_buf, activity_buf, restart = start_snapshots(ctx)
+
+    sock = socket.create_server(('0.0.0.0', http_port), backlog=128)
+    restart_supported = hasattr(active_reader, 'restart_device')
+    procs = [ctx.Process(
+                 target=http_worker, daemon=True,
+                 args=(sock, aircraft_buf.name, activity_buf.name,
+                       restart, restart_supported, refresh_ms))
+             for _ in range(workers)]
+    for proc in procs:
+        proc.start()
+    print(f"[HTTP] {workers} worker processes serving from shared memory")
+
+    try:
+        for proc in procs:
+            proc.join()
+    except KeyboardInterrupt:
+        print("\n[SERVER] Shutting down...")
+    finally:
+        for proc in procs:
+            proc.terminate()
+            proc.join()
+        sock.close()
+        aircraft_buf.close()
+        activity_buf.close()
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
@@ -523,8 +1116,31 @@ def main():
                         help=f'HTTP server port (default: {HTTP_PORT})')
     parser.add_argument('--no-log', action='store_true',
                         help='Disable automatic serial logging')
+    parser.add_argument('--listen', type=parse_listen_spec, action='append',
+                        default=[], metavar='URL',
+                        help='Accept sensor data over the network, e.g. '
+                             'tcp://0.0.0.0:30005 or udp://0.0.0.0:30005 '
+                             '(repeatable)')
+    parser.add_argument('--workers', type=int, default=0,
+                        help='Serve HTTP from this many worker processes, '
+                             'fed over shared memory (default: 0, '
+                             'single process)')
+    parser.add_argument('--snapshot-cache', action='store_true',
+                        help='Single process: serve aircraft.json from a '
+                             'snapshot encoded every '
+                             f'{PUBLISH_INTERVAL_S}s (implied by --workers)')
+    parser.add_argument('--refresh', type=int, default=REFRESH_MS,
+                        help=f'Dashboard poll interval in ms '
+                             f'(default: {REFRESH_MS})')
     args = parser.parse_args()
 
+    global refresh_ms
+    refresh_ms = max(250, args.refresh)
+    if (args.workers > 0 or args.snapshot_cache) and shared_memory is None:
+        print("[ERROR] --workers/--snapshot-cache need Python 3.8+ "
+              "(multiprocessing.shared_memory)")
+        sys.exit(1)
+
     print("=" * 60)
     print("  SKY-SPY-Aware - Live Drone Detection Dashboard")
     print("=" * 60)
@@ -537,6 +1153,9 @@ def main():
             sys.exit(1)
         reader = ReplayReader(replay_path, fast=args.fast)
         reader.start()
+    elif args.listen and args.port is None:
+        # Network-only mode: no local serial port wanted
+        pass
     else:
         # Live serial mode
         if serial is None:
@@ -567,10 +1186,20 @@ def main():
         active_reader = reader
         reader.start()
 
+    if args.listen:
+        NetworkReader(args.listen).start()
+
     # Start HTTP server
     print(f"\n[HTTP] Starting web server on http://localhost:{args.http_port}")
     print(f"[HTTP] Open http://localhost:{args.http_port} in your browser\n")
 
+    if args.workers > 0:
+        serve_workers(args.http_port, args.workers)
+        return
+    if args.snapshot_cache:
+        serve_snapshot_cache(args.http_port)
+        return
+
     httpd = HTTPServer(('0.0.0.0', args.http_port), SkySpyHandler)
     try:
         httpd.serve_forever()